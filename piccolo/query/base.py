@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import typing as t
-from time import time
+from time import perf_counter_ns
 
 from piccolo.columns.column_types import JSON, JSONB
 from piccolo.custom_types import QueryResponseType, TableInstance
 from piccolo.query.mixins import ColumnsDelegate
 from piccolo.querystring import QueryString
 from piccolo.utils.encoding import load_json
-from piccolo.utils.objects import make_nested_object
+from piccolo.utils.objects import make_nested_objects
 from piccolo.utils.sync import run_sync
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -17,16 +17,34 @@ if t.TYPE_CHECKING:  # pragma: no cover
 
 
 class Timer:
+    __slots__ = ("start", "end")
+
     def __enter__(self):
-        self.start = time()
+        self.start = perf_counter_ns()
 
     def __exit__(self, exception_type, exception, traceback):
-        self.end = time()
-        print(f"Duration: {self.end - self.start}s")
+        self.end = perf_counter_ns()
+        print(f"Duration: {(self.end - self.start) / 1e9}s")
 
 
 class Query(t.Generic[TableInstance, QueryResponseType]):
-    __slots__ = ("table", "_frozen_querystrings")
+    __slots__ = (
+        "table",
+        "_frozen_querystrings",
+        "_engine_type",
+        "_json_column_names",
+        "_response_keys",
+    )
+
+    # Subclasses which support these delegates set them in `__init__`. Having
+    # defaults here means `_process_results` can access them directly, rather
+    # than using `getattr` / `hasattr`.
+    output_delegate: t.Optional[OutputDelegate] = None
+    columns_delegate: t.Optional[ColumnsDelegate] = None
+
+    # Subclasses can override this to access the raw response, before it's
+    # processed any further - see `Insert`.
+    _raw_response_callback: t.Optional[t.Callable[[t.List], None]] = None
 
     def __init__(
         self,
@@ -35,19 +53,72 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
     ):
         self.table = table
         self._frozen_querystrings = frozen_querystrings
+        self._engine_type: t.Optional[str] = None
+        self._json_column_names: t.Optional[t.Sequence[str]] = None
+        self._response_keys: t.Optional[
+            t.Tuple[t.Tuple[str, ...], t.List[str]]
+        ] = None
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        """
+        The engine type is looked up once, and then cached on the query, as
+        it's accessed several times each time the query runs.
+        """
+        if self._engine_type is None:
+            engine = self.table._meta.db
+            if not engine:
+                raise ValueError("Engine isn't defined.")
+            self._engine_type = engine.engine_type
+        return self._engine_type
+
+    def _get_json_column_names(self) -> t.Sequence[str]:
+        """
+        Returns the names of any JSON columns in the response, so their
+        values can be deserialised when ``load_json`` is requested.
+        """
+        columns_delegate = self.columns_delegate
+
+        if columns_delegate is None:
+            return self.table._meta.json_column_names
+
+        json_column_names = []
+        for column in columns_delegate.selected_columns:
+            if not isinstance(column, (JSON, JSONB)):
+                continue
+
+            if column._alias is not None:
+                json_column_names.append(column._alias)
+            elif len(column._meta.call_chain) > 0:
+                json_column_names.append(
+                    column._meta.get_default_alias().replace("$", ".")
+                )
+            else:
+                json_column_names.append(column._meta.name)
+
+        return json_column_names
+
+    def _get_response_keys(self, results) -> t.List[str]:
+        """
+        Works out the keys to use for each row in the response.
+
+        Queries which are run repeatedly (for example, frozen queries) return
+        the same columns each time, so the result is cached.
+        """
+        keys = tuple(results[0].keys())
+
+        if self._response_keys is not None:
+            cached_keys, response_keys = self._response_keys
+            if cached_keys == keys:
+                return response_keys
+
+        response_keys = [i.replace("$", ".") for i in keys]
+        self._response_keys = (keys, response_keys)
+        return response_keys
 
     async def _process_results(self, results) -> QueryResponseType:
         if results:
-            keys = results[0].keys()
-            keys = [i.replace("$", ".") for i in keys]
+            keys = self._get_response_keys(results)
             if self.engine_type in ("postgres", "cockroach"):
                 # asyncpg returns a special Record object. We can pass it
                 # directly into zip without calling `values` on it. This can
@@ -60,73 +131,53 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
         else:
             raw = []
 
-        if hasattr(self, "_raw_response_callback"):
+        if self._raw_response_callback is not None:
             self._raw_response_callback(raw)
 
-        output: t.Optional[OutputDelegate] = getattr(
-            self, "output_delegate", None
-        )
+        output = self.output_delegate
 
         #######################################################################
 
         if output and output._output.load_json:
-            columns_delegate: t.Optional[ColumnsDelegate] = getattr(
-                self, "columns_delegate", None
-            )
-
-            if columns_delegate is not None:
-                json_columns = [
-                    i
-                    for i in columns_delegate.selected_columns
-                    if isinstance(i, (JSON, JSONB))
-                ]
-            else:
-                json_columns = self.table._meta.json_columns
-
-            json_column_names = []
-            for column in json_columns:
-                if column._alias is not None:
-                    json_column_names.append(column._alias)
-                elif len(column._meta.call_chain) > 0:
-                    json_column_names.append(
-                        column._meta.get_default_alias().replace("$", ".")
-                    )
-                else:
-                    json_column_names.append(column._meta.name)
-
-            processed_raw = []
-
-            for row in raw:
-                new_row = {**row}
+            json_column_names = self._json_column_names
+            if json_column_names is None:
+                json_column_names = self._get_json_column_names()
+
+            # If none of the columns are JSON, there's nothing to
+            # deserialise, so we can skip iterating over every row.
+            if json_column_names and raw:
+                # Every row has the same keys, so we only need to check once
+                # which of the JSON columns are actually in the response.
+                first_row = raw[0]
+
+                # The rows were created above, so it's safe to modify them in
+                # place rather than copying them.
                 for json_column_name in json_column_names:
-                    value = new_row.get(json_column_name)
-                    if value is not None:
-                        new_row[json_column_name] = load_json(value)
-                processed_raw.append(new_row)
+                    if json_column_name not in first_row:
+                        continue
 
-            raw = processed_raw
+                    for row in raw:
+                        value = row[json_column_name]
+                        if value is not None:
+                            row[json_column_name] = load_json(value)
 
         #######################################################################
 
-        raw = await self.response_handler(raw)
+        # Most queries don't override `response_handler`, in which case we
+        # can avoid the overhead of creating and awaiting a coroutine.
+        if type(self).response_handler is not Query.response_handler:
+            raw = await self.response_handler(raw)
 
+        # `t.cast` is a function call at runtime, so we use `type: ignore`
+        # instead, as this runs for every query.
         if output:
             if output._output.as_objects:
                 if output._output.nested:
-                    return t.cast(
-                        QueryResponseType,
-                        [make_nested_object(row, self.table) for row in raw],
-                    )
+                    return make_nested_objects(raw, self.table)  # type: ignore
                 else:
-                    return t.cast(
-                        QueryResponseType,
-                        [
-                            self.table(**columns, _exists_in_db=True)
-                            for columns in raw
-                        ],
-                    )
+                    return self.table._from_db_rows(raw)  # type: ignore
 
-        return t.cast(QueryResponseType, raw)
+        return raw  # type: ignore
 
     def _validate(self):
         """
@@ -232,6 +283,13 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
 
     ###########################################################################
 
+    # Maps each engine type to the property which generates its querystrings.
+    _engine_querystrings: t.Dict[str, str] = {
+        "postgres": "postgres_querystrings",
+        "sqlite": "sqlite_querystrings",
+        "cockroach": "cockroach_querystrings",
+    }
+
     @property
     def sqlite_querystrings(self) -> t.Sequence[QueryString]:
         raise NotImplementedError
@@ -257,26 +315,17 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
             return self._frozen_querystrings
 
         engine_type = self.engine_type
-        if engine_type == "postgres":
-            try:
-                return self.postgres_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        elif engine_type == "sqlite":
-            try:
-                return self.sqlite_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        elif engine_type == "cockroach":
-            try:
-                return self.cockroach_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        else:
+        property_name = self._engine_querystrings.get(engine_type)
+        if property_name is None:
             raise Exception(
                 f"No querystring found for the {engine_type} engine."
             )
 
+        try:
+            return getattr(self, property_name)
+        except NotImplementedError:
+            return self.default_querystrings
+
     ###########################################################################
 
     def freeze(self) -> FrozenQuery:
@@ -329,10 +378,14 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
             # Needed for `response_handler`
             query.limit_delegate = self.limit_delegate.copy()  # type: ignore
 
-        if hasattr(self, "output_delegate"):
+        if self.output_delegate is not None:
             # Needed for `_process_results`
             query.output_delegate = self.output_delegate.copy()  # type: ignore
 
+            # The selected columns don't change once frozen, so we can work
+            # out which ones need deserialising up front.
+            query._json_column_names = self._get_json_column_names()
+
         return FrozenQuery(query=query)
 
     ###########################################################################
@@ -345,14 +398,22 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
 
 
 class FrozenQuery:
+    __slots__ = ("query", "run", "run_sync")
+
     def __init__(self, query: Query):
         self.query = query
 
-    async def run(self, *args, **kwargs):
-        return await self.query.run(*args, **kwargs)
+        # Bind these directly, rather than wrapping them, so there's no extra
+        # function call or coroutine each time the query is run.
+        self.run = query.run
+        self.run_sync = query.run_sync
 
-    def run_sync(self, *args, **kwargs):
-        return self.query.run_sync(*args, **kwargs)
+    def __await__(self):
+        """
+        If the user doesn't explicity call .run(), proxy to it as a
+        convenience.
+        """
+        return self.run().__await__()
 
     def __getattr__(self, name: str):
         if hasattr(self.query, name):
@@ -371,18 +432,30 @@ class FrozenQuery:
 
 
 class DDL:
-    __slots__ = ("table",)
+    __slots__ = ("table", "_engine_type")
 
     def __init__(self, table: t.Type[Table], **kwargs):
         self.table = table
+        self._engine_type: t.Optional[str] = None
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        """
+        Cached after the first lookup - see ``Query.engine_type``.
+        """
+        if self._engine_type is None:
+            engine = self.table._meta.db
+            if not engine:
+                raise ValueError("Engine isn't defined.")
+            self._engine_type = engine.engine_type
+        return self._engine_type
+
+    # Maps each engine type to the property which generates its DDL.
+    _engine_ddl: t.Dict[str, str] = {
+        "postgres": "postgres_ddl",
+        "sqlite": "sqlite_ddl",
+        "cockroach": "cockroach_ddl",
+    }
 
     @property
     def sqlite_ddl(self) -> t.Sequence[str]:
@@ -406,26 +479,17 @@ class DDL:
         Calls the correct underlying method, depending on the current engine.
         """
         engine_type = self.engine_type
-        if engine_type == "postgres":
-            try:
-                return self.postgres_ddl
-            except NotImplementedError:
-                return self.default_ddl
-        elif engine_type == "sqlite":
-            try:
-                return self.sqlite_ddl
-            except NotImplementedError:
-                return self.default_ddl
-        elif engine_type == "cockroach":
-            try:
-                return self.cockroach_ddl
-            except NotImplementedError:
-                return self.default_ddl
-        else:
+        property_name = self._engine_ddl.get(engine_type)
+        if property_name is None:
             raise Exception(
                 f"No querystring found for the {engine_type} engine."
             )
 
+        try:
+            return getattr(self, property_name)
+        except NotImplementedError:
+            return self.default_ddl
+
     def __await__(self):
         """
         If the user doesn't explicity call .run(), proxy to it as a
@@ -441,10 +505,13 @@ class DDL:
                 "_meta"
             )
 
-        if len(self.ddl) == 1:
-            return await engine.run_ddl(self.ddl[0], in_pool=in_pool)
+        # The DDL is generated each time the property is accessed.
+        ddl_statements = self.ddl
+
+        if len(ddl_statements) == 1:
+            return await engine.run_ddl(ddl_statements[0], in_pool=in_pool)
         responses = []
-        for ddl in self.ddl:
+        for ddl in ddl_statements:
             response = await engine.run_ddl(ddl, in_pool=in_pool)
             responses.append(response)
         return responses
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools
 import typing as t
 from dataclasses import dataclass
 
@@ -27,29 +26,43 @@ class AlterStatement:
 
 @dataclass
 class RenameTable(AlterStatement):
-    __slots__ = ("new_name",)
+    __slots__ = ("new_name", "_ddl")
 
     new_name: str
 
+    def __post_init__(self):
+        self._ddl = f"RENAME TO {self.new_name}"
+
     @property
     def ddl(self) -> str:
-        return f"RENAME TO {self.new_name}"
+        return self._ddl
+
+
+def _get_column_name(column: t.Union[Column, str]) -> str:
+    if isinstance(column, str):
+        return column
+    elif isinstance(column, Column):
+        return column._meta.db_column_name
+    else:
+        raise ValueError("Unrecognised column type")
 
 
 @dataclass
 class AlterColumnStatement(AlterStatement):
-    __slots__ = ("column",)
+    __slots__ = ("column", "_column_name", "_quoted_name")
 
     column: t.Union[Column, str]
 
+    def __post_init__(self):
+        # Resolved once here, so an unrecognised column type is raised
+        # straight away, and the subclasses don't need to check the type each
+        # time they generate their DDL.
+        self._column_name = _get_column_name(self.column)
+        self._quoted_name = f'"{self._column_name}"'
+
     @property
     def column_name(self) -> str:
-        if isinstance(self.column, str):
-            return self.column
-        elif isinstance(self.column, Column):
-            return self.column._meta.db_column_name
-        else:
-            raise ValueError("Unrecognised column type")
+        return self._column_name
 
 
 @dataclass
@@ -60,14 +73,16 @@ class RenameColumn(AlterColumnStatement):
 
     @property
     def ddl(self) -> str:
-        return f'RENAME COLUMN "{self.column_name}" TO "{self.new_name}"'
+        return f'RENAME COLUMN {self._quoted_name} TO "{self.new_name}"'
 
 
 @dataclass
 class DropColumn(AlterColumnStatement):
+    __slots__ = ()  # type: ignore
+
     @property
     def ddl(self) -> str:
-        return f'DROP COLUMN "{self.column_name}"'
+        return f"DROP COLUMN {self._quoted_name}"
 
 
 @dataclass
@@ -85,12 +100,13 @@ class AddColumn(AlterColumnStatement):
 
 @dataclass
 class DropDefault(AlterColumnStatement):
+    __slots__ = ()  # type: ignore
+
     @property
     def ddl(self) -> str:
-        return f'ALTER COLUMN "{self.column_name}" DROP DEFAULT'
+        return f"ALTER COLUMN {self._quoted_name} DROP DEFAULT"
 
 
-@dataclass
 class SetColumnType(AlterStatement):
     """
     :param using_expression:
@@ -100,9 +116,19 @@ class SetColumnType(AlterStatement):
 
     """
 
-    old_column: Column
-    new_column: Column
-    using_expression: t.Optional[str] = None
+    __slots__ = ("old_column", "new_column", "using_expression")
+
+    # This has a hand written `__init__` rather than being a dataclass, for
+    # the same reason as `AddForeignKeyConstraint`.
+    def __init__(
+        self,
+        old_column: Column,
+        new_column: Column,
+        using_expression: t.Optional[str] = None,
+    ):
+        self.old_column = old_column
+        self.new_column = new_column
+        self.using_expression = using_expression
 
     @property
     def ddl(self) -> str:
@@ -120,15 +146,25 @@ class SetColumnType(AlterStatement):
 
 @dataclass
 class SetDefault(AlterColumnStatement):
-    __slots__ = ("value",)
+    __slots__ = ("value", "_ddl")
 
     column: Column
     value: t.Any
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._ddl: t.Optional[str] = None
+
     @property
     def ddl(self) -> str:
-        sql_value = self.column.get_sql_value(self.value)
-        return f'ALTER COLUMN "{self.column_name}" SET DEFAULT {sql_value}'
+        # Converting the value to SQL can be relatively expensive, so the
+        # result is cached.
+        if self._ddl is None:
+            sql_value = self.column.get_sql_value(self.value)
+            self._ddl = (
+                f"ALTER COLUMN {self._quoted_name} SET DEFAULT {sql_value}"
+            )
+        return self._ddl
 
 
 @dataclass
@@ -140,7 +176,7 @@ class SetUnique(AlterColumnStatement):
     @property
     def ddl(self) -> str:
         if self.boolean:
-            return f'ADD UNIQUE ("{self.column_name}")'
+            return f"ADD UNIQUE ({self._quoted_name})"
         if isinstance(self.column, str):
             raise ValueError(
                 "Removing a unique constraint requires a Column instance "
@@ -161,9 +197,9 @@ class SetNull(AlterColumnStatement):
     @property
     def ddl(self) -> str:
         if self.boolean:
-            return f'ALTER COLUMN "{self.column_name}" DROP NOT NULL'
+            return f"ALTER COLUMN {self._quoted_name} DROP NOT NULL"
         else:
-            return f'ALTER COLUMN "{self.column_name}" SET NOT NULL'
+            return f"ALTER COLUMN {self._quoted_name} SET NOT NULL"
 
 
 @dataclass
@@ -174,21 +210,23 @@ class SetLength(AlterColumnStatement):
 
     @property
     def ddl(self) -> str:
-        return f'ALTER COLUMN "{self.column_name}" TYPE VARCHAR({self.length})'
+        return f"ALTER COLUMN {self._quoted_name} TYPE VARCHAR({self.length})"
 
 
 @dataclass
 class DropConstraint(AlterStatement):
-    __slots__ = ("constraint_name",)
+    __slots__ = ("constraint_name", "_ddl")
 
     constraint_name: str
 
+    def __post_init__(self):
+        self._ddl = f"DROP CONSTRAINT IF EXISTS {self.constraint_name}"
+
     @property
     def ddl(self) -> str:
-        return f"DROP CONSTRAINT IF EXISTS {self.constraint_name}"
+        return self._ddl
 
 
-@dataclass
 class AddForeignKeyConstraint(AlterStatement):
     __slots__ = (
         "constraint_name",
@@ -196,27 +234,44 @@ class AddForeignKeyConstraint(AlterStatement):
         "referenced_table_name",
         "on_delete",
         "on_update",
+        "referenced_column_name",
+        "_ddl",
     )
 
-    constraint_name: str
-    foreign_key_column_name: str
-    referenced_table_name: str
-    on_delete: t.Optional[OnDelete]
-    on_update: t.Optional[OnUpdate]
-    referenced_column_name: str = "id"
+    # This has a hand written `__init__` rather than being a dataclass, as
+    # `referenced_column_name` has a default value, which a dataclass would
+    # store as a class attribute, clashing with `__slots__`.
+    def __init__(
+        self,
+        constraint_name: str,
+        foreign_key_column_name: str,
+        referenced_table_name: str,
+        on_delete: t.Optional[OnDelete],
+        on_update: t.Optional[OnUpdate],
+        referenced_column_name: str = "id",
+    ):
+        self.constraint_name = constraint_name
+        self.foreign_key_column_name = foreign_key_column_name
+        self.referenced_table_name = referenced_table_name
+        self.on_delete = on_delete
+        self.on_update = on_update
+        self.referenced_column_name = referenced_column_name
+
+        # None of the values change, so we build the DDL up front.
+        query = (
+            f'ADD CONSTRAINT "{constraint_name}" FOREIGN KEY '
+            f'("{foreign_key_column_name}") REFERENCES '
+            f'"{referenced_table_name}" ("{referenced_column_name}")'
+        )
+        if on_delete:
+            query += f" ON DELETE {on_delete.value}"
+        if on_update:
+            query += f" ON UPDATE {on_update.value}"
+        self._ddl = query
 
     @property
     def ddl(self) -> str:
-        query = (
-            f'ADD CONSTRAINT "{self.constraint_name}" FOREIGN KEY '
-            f'("{self.foreign_key_column_name}") REFERENCES '
-            f'"{self.referenced_table_name}" ("{self.referenced_column_name}")'
-        )
-        if self.on_delete:
-            query += f" ON DELETE {self.on_delete.value}"
-        if self.on_update:
-            query += f" ON UPDATE {self.on_update.value}"
-        return query
+        return self._ddl
 
 
 @dataclass
@@ -229,29 +284,34 @@ class SetDigits(AlterColumnStatement):
     @property
     def ddl(self) -> str:
         if self.digits is None:
-            return f'ALTER COLUMN "{self.column_name}" TYPE {self.column_type}'
+            return f"ALTER COLUMN {self._quoted_name} TYPE {self.column_type}"
 
         precision = self.digits[0]
         scale = self.digits[1]
         return (
-            f'ALTER COLUMN "{self.column_name}" TYPE '
+            f"ALTER COLUMN {self._quoted_name} TYPE "
             f"{self.column_type}({precision}, {scale})"
         )
 
 
 @dataclass
 class SetSchema(AlterStatement):
-    __slots__ = ("schema_name",)
+    __slots__ = ("schema_name", "_ddl")
 
     schema_name: str
 
+    def __post_init__(self):
+        self._ddl = f'SET SCHEMA "{self.schema_name}"'
+
     @property
     def ddl(self) -> str:
-        return f'SET SCHEMA "{self.schema_name}"'
+        return self._ddl
 
 
 @dataclass
 class DropTable:
+    __slots__ = ("table", "cascade", "if_exists")
+
     table: t.Type[Table]
     cascade: bool
     if_exists: bool
@@ -292,21 +352,25 @@ class Alter(DDL):
 
     def __init__(self, table: t.Type[Table], **kwargs):
         super().__init__(table, **kwargs)
-        self._add_foreign_key_constraint: t.List[AddForeignKeyConstraint] = []
-        self._add: t.List[AddColumn] = []
-        self._drop_constraint: t.List[DropConstraint] = []
-        self._drop_default: t.List[DropDefault] = []
+        # Empty tuples are shared rather than allocated each time, which
+        # helps as most alter queries only use one or two of these.
+        self._add_foreign_key_constraint: t.Tuple[
+            AddForeignKeyConstraint, ...
+        ] = ()
+        self._add: t.Tuple[AddColumn, ...] = ()
+        self._drop_constraint: t.Tuple[DropConstraint, ...] = ()
+        self._drop_default: t.Tuple[DropDefault, ...] = ()
         self._drop_table: t.Optional[DropTable] = None
-        self._drop: t.List[DropColumn] = []
-        self._rename_columns: t.List[RenameColumn] = []
-        self._rename_table: t.List[RenameTable] = []
-        self._set_column_type: t.List[SetColumnType] = []
-        self._set_default: t.List[SetDefault] = []
-        self._set_digits: t.List[SetDigits] = []
-        self._set_length: t.List[SetLength] = []
-        self._set_null: t.List[SetNull] = []
-        self._set_schema: t.List[SetSchema] = []
-        self._set_unique: t.List[SetUnique] = []
+        self._drop: t.Tuple[DropColumn, ...] = ()
+        self._rename_columns: t.Tuple[RenameColumn, ...] = ()
+        self._rename_table: t.Tuple[RenameTable, ...] = ()
+        self._set_column_type: t.Tuple[SetColumnType, ...] = ()
+        self._set_default: t.Tuple[SetDefault, ...] = ()
+        self._set_digits: t.Tuple[SetDigits, ...] = ()
+        self._set_length: t.Tuple[SetLength, ...] = ()
+        self._set_null: t.Tuple[SetNull, ...] = ()
+        self._set_schema: t.Tuple[SetSchema, ...] = ()
+        self._set_unique: t.Tuple[SetUnique, ...] = ()
 
     def add_column(self: Self, name: str, column: Column) -> Self:
         """
@@ -322,7 +386,7 @@ class Alter(DDL):
         if isinstance(column, ForeignKey):
             column._setup(table_class=self.table)
 
-        self._add.append(AddColumn(column, name))
+        self._add += (AddColumn(column, name),)
         return self
 
     def drop_column(self, column: t.Union[str, Column]) -> Alter:
@@ -332,7 +396,7 @@ class Alter(DDL):
             >>> await Band.alter().drop_column(Band.popularity)
 
         """
-        self._drop.append(DropColumn(column))
+        self._drop += (DropColumn(column),)
         return self
 
     def drop_default(self, column: t.Union[str, Column]) -> Alter:
@@ -342,7 +406,7 @@ class Alter(DDL):
             >>> await Band.alter().drop_default(Band.popularity)
 
         """
-        self._drop_default.append(DropDefault(column=column))
+        self._drop_default += (DropDefault(column=column),)
         return self
 
     def drop_table(
@@ -369,7 +433,7 @@ class Alter(DDL):
 
         """
         # We override the existing one rather than appending.
-        self._rename_table = [RenameTable(new_name=new_name)]
+        self._rename_table = (RenameTable(new_name=new_name),)
         return self
 
     def rename_column(
@@ -385,7 +449,7 @@ class Alter(DDL):
             >>> await Band.alter().rename_column('popularity', 'rating')
 
         """
-        self._rename_columns.append(RenameColumn(column, new_name))
+        self._rename_columns += (RenameColumn(column, new_name),)
         return self
 
     def set_column_type(
@@ -406,12 +470,12 @@ class Alter(DDL):
             ``'name::integer'``.
 
         """
-        self._set_column_type.append(
+        self._set_column_type += (
             SetColumnType(
                 old_column=old_column,
                 new_column=new_column,
                 using_expression=using_expression,
-            )
+            ),
         )
         return self
 
@@ -422,7 +486,7 @@ class Alter(DDL):
             >>> await Band.alter().set_default(Band.popularity, 0)
 
         """
-        self._set_default.append(SetDefault(column=column, value=value))
+        self._set_default += (SetDefault(column=column, value=value),)
         return self
 
     def set_null(
@@ -438,7 +502,7 @@ class Alter(DDL):
             >>> await Band.alter().set_null('name', True)
 
         """
-        self._set_null.append(SetNull(column, boolean))
+        self._set_null += (SetNull(column, boolean),)
         return self
 
     def set_unique(
@@ -454,7 +518,7 @@ class Alter(DDL):
             >>> await Band.alter().set_unique('name', True)
 
         """
-        self._set_unique.append(SetUnique(column, boolean))
+        self._set_unique += (SetUnique(column, boolean),)
         return self
 
     def set_length(self, column: t.Union[str, Varchar], length: int) -> Alter:
@@ -482,17 +546,17 @@ class Alter(DDL):
                 "Only Varchar columns can have their length changed."
             )
 
-        self._set_length.append(SetLength(column, length))
+        self._set_length += (SetLength(column, length),)
         return self
 
     def _get_constraint_name(self, column: t.Union[str, ForeignKey]) -> str:
-        column_name = AlterColumnStatement(column=column).column_name
+        column_name = _get_column_name(column)
         tablename = self.table._meta.tablename
         return f"{tablename}_{column_name}_fk"
 
     def drop_constraint(self, constraint_name: str) -> Alter:
-        self._drop_constraint.append(
-            DropConstraint(constraint_name=constraint_name)
+        self._drop_constraint += (
+            DropConstraint(constraint_name=constraint_name),
         )
         return self
 
@@ -521,9 +585,9 @@ class Alter(DDL):
 
         """
         constraint_name = self._get_constraint_name(column=column)
-        column_name = AlterColumnStatement(column=column).column_name
+        column_name = _get_column_name(column)
 
-        self._add_foreign_key_constraint.append(
+        self._add_foreign_key_constraint += (
             AddForeignKeyConstraint(
                 constraint_name=constraint_name,
                 foreign_key_column_name=column_name,
@@ -531,7 +595,7 @@ class Alter(DDL):
                 on_delete=on_delete,
                 on_update=on_update,
                 referenced_column_name=referenced_column_name,
-            )
+            ),
         )
         return self
 
@@ -548,12 +612,12 @@ class Alter(DDL):
             if isinstance(column, Numeric)
             else "NUMERIC"
         )
-        self._set_digits.append(
+        self._set_digits += (
             SetDigits(
                 digits=digits,
                 column=column,
                 column_type=column_type,
-            )
+            ),
         )
         return self
 
@@ -565,7 +629,7 @@ class Alter(DDL):
             The schema to move the table to.
 
         """
-        self._set_schema.append(SetSchema(schema_name=schema_name))
+        self._set_schema += (SetSchema(schema_name=schema_name),)
         return self
 
     @property
@@ -575,32 +639,35 @@ class Alter(DDL):
 
         query = f"ALTER TABLE {self.table._meta.get_formatted_tablename()}"
 
-        alterations = [
-            i.ddl
-            for i in itertools.chain(
-                self._add,
-                self._rename_columns,
-                self._rename_table,
-                self._drop,
-                self._drop_default,
-                self._set_column_type,
-                self._set_unique,
-                self._set_null,
-                self._set_length,
-                self._set_default,
-                self._set_digits,
-                self._set_schema,
-            )
-        ]
+        # The order matters - it's the order the alterations are applied in.
+        statement_groups = (
+            self._add,
+            self._rename_columns,
+            self._rename_table,
+            self._drop,
+            self._drop_default,
+            self._set_column_type,
+            self._set_unique,
+            self._set_null,
+            self._set_length,
+            self._set_default,
+            self._set_digits,
+            self._set_schema,
+        )
 
         if self.engine_type == "sqlite":
             # Can only perform one alter statement at a time.
-            return [f"{query} {i}" for i in alterations]
-
-        # Postgres can perform them all at once:
-        query += ",".join(f" {i}" for i in alterations)
-
-        return [query]
+            prefix = f"{query} "
+            return [
+                prefix + i.ddl for group in statement_groups for i in group
+            ]
+
+        # Postgres can perform them all at once. Joining a list rather than a
+        # generator lets `str.join` work out the size of the result upfront.
+        alterations = ",".join(
+            [f" {i.ddl}" for group in statement_groups for i in group]
+        )
+        return [query + alterations]
 
 
 Self = t.TypeVar("Self", bound=Alter)
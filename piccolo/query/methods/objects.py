@@ -196,6 +196,8 @@ class Objects(
         "where_delegate",
     )
 
+    output_delegate: OutputDelegate
+
     def __init__(
         self,
         table: t.Type[TableInstance],
@@ -146,6 +146,9 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         "where_delegate",
     )
 
+    columns_delegate: ColumnsDelegate
+    output_delegate: OutputDelegate
+
     def __init__(
         self,
         table: t.Type[TableInstance],
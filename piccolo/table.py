@@ -83,6 +83,7 @@ class TableMeta:
     foreign_key_columns: t.List[ForeignKey] = field(default_factory=list)
     primary_key: Column = field(default_factory=Column)
     json_columns: t.List[t.Union[JSON, JSONB]] = field(default_factory=list)
+    json_column_names: t.Tuple[str, ...] = field(init=False, default=())
     secret_columns: t.List[Secret] = field(default_factory=list)
     auto_update_columns: t.List[Column] = field(default_factory=list)
     tags: t.List[str] = field(default_factory=list)
@@ -96,6 +97,11 @@ class TableMeta:
     # Piccolo API.
     _foreign_key_references: t.List[ForeignKey] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Worked out once here, as it's needed each time a query response
+        # containing JSON values is deserialised.
+        self.json_column_names = tuple(i._meta.name for i in self.json_columns)
+
     def get_formatted_tablename(
         self, include_schema: bool = True, quoted: bool = True
     ) -> str:
@@ -465,6 +471,55 @@ class Table(metaclass=TableMetaclass):
         """
         return cls(**data)
 
+    @classmethod
+    def _from_db_rows(
+        cls: t.Type[TableInstance], rows: t.Sequence[t.Dict[str, t.Any]]
+    ) -> t.List[TableInstance]:
+        """
+        Creates instances from rows returned by the database.
+
+        When a row contains a value for every column, we can assign them
+        directly, and skip the defaults and validation in the constructor,
+        which is much faster when fetching lots of rows. Otherwise, or if the
+        subclass has its own constructor or attribute setters, we fall back to
+        calling the constructor.
+        """
+        if (
+            cls.__init__ is not Table.__init__
+            or cls.__setattr__ is not Table.__setattr__
+            or cls.__setitem__ is not Table.__setitem__
+        ):
+            return [cls(**row, _exists_in_db=True) for row in rows]
+
+        # Look these up once, rather than for every row.
+        column_names = [
+            (i._meta.name, i._meta.db_column_name) for i in cls._meta.columns
+        ]
+        column_count = len(column_names)
+
+        instances: t.List[TableInstance] = []
+
+        for row in rows:
+            if len(row) == column_count:
+                try:
+                    values = {
+                        name: row[db_column_name]
+                        for name, db_column_name in column_names
+                    }
+                except KeyError:
+                    pass
+                else:
+                    instance = cls.__new__(cls)
+                    instance.__dict__.update(values)
+                    instance._exists_in_db = True
+                    instance._was_created = None
+                    instances.append(instance)
+                    continue
+
+            instances.append(cls(**row, _exists_in_db=True))
+
+        return instances
+
     ###########################################################################
 
     def save(
@@ -1469,19 +1524,23 @@ async def drop_db_tables(*tables: t.Type[Table]) -> None:
         # SQLite doesn't support CASCADE, so we have to drop them in the
         # correct order.
         sorted_table_classes = reversed(sort_table_classes(list(tables)))
-        ddl_statements = [
-            Alter(table=table).drop_table(if_exists=True)
-            for table in sorted_table_classes
-        ]
+        atomic = engine.atomic()
+        atomic.add(
+            *[
+                Alter(table=table).drop_table(if_exists=True)
+                for table in sorted_table_classes
+            ]
+        )
+        await atomic.run()
     else:
-        ddl_statements = [
-            table.alter().drop_table(cascade=True, if_exists=True)
-            for table in tables
-        ]
-
-    atomic = engine.atomic()
-    atomic.add(*ddl_statements)
-    await atomic.run()
+        # Drop them all in a single statement, rather than one per table.
+        # The same table can't appear twice in the statement.
+        tablenames = dict.fromkeys(
+            table._meta.get_formatted_tablename() for table in tables
+        )
+        await engine.run_ddl(
+            f"DROP TABLE IF EXISTS {', '.join(tablenames)} CASCADE"
+        )
 
 
 def drop_db_tables_sync(*tables: t.Type[Table]) -> None:
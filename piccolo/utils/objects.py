@@ -38,27 +38,45 @@ def make_nested_object(
         1
 
     """
-    table_params: t.Dict[str, t.Any] = {}
+    return make_nested_objects([row], table_class)[0]
 
-    for key, value in row.items():
+
+def make_nested_objects(
+    rows: t.Sequence[t.Dict[str, t.Any]], table_class: t.Type[Table]
+) -> t.List[Table]:
+    """
+    The same as ``make_nested_object``, but for a list of rows. The rows all
+    come from the same query, so we only need to work out once which keys
+    belong to related tables, rather than for every row.
+    """
+    if not rows:
+        return []
+
+    related_table_classes: t.Dict[str, t.Type[Table]] = {}
+
+    for key, value in rows[0].items():
         if isinstance(value, dict):
             # This is probably a related table.
             fk_column = table_class._meta.get_column_by_name(key)
 
             if isinstance(fk_column, ForeignKey):
-                related_table_class = (
+                related_table_classes[key] = (
                     fk_column._foreign_key_meta.resolved_references
                 )
-                table_params[key] = make_nested_object(
-                    value, related_table_class
-                )
-            else:
-                # The value doesn't belong to a foreign key, so just append it.
-                table_params[key] = value
-
-        else:
-            table_params[key] = value
 
-    table_instance = table_class(**table_params)
-    table_instance._exists_in_db = True
-    return table_instance
+    all_table_params = [dict(row) for row in rows]
+
+    for key, related_table_class in related_table_classes.items():
+        indexes = [
+            index
+            for index, table_params in enumerate(all_table_params)
+            if isinstance(table_params[key], dict)
+        ]
+        related_objects = make_nested_objects(
+            [all_table_params[index][key] for index in indexes],
+            related_table_class,
+        )
+        for index, related_object in zip(indexes, related_objects):
+            all_table_params[index][key] = related_object
+
+    return table_class._from_db_rows(all_table_params)
@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import itertools
 import os
-import random
-import shutil
 import tempfile
-import time
 import typing as t
 import uuid
+from functools import partial
 from unittest.mock import MagicMock, patch
 
 from piccolo.apps.migrations.auto.operations import RenameTable
@@ -53,7 +52,7 @@ from piccolo.conf.apps import AppConfig
 from piccolo.schema import SchemaManager
 from piccolo.table import Table, create_table_class, drop_db_tables_sync
 from piccolo.utils.sync import run_sync
-from tests.base import DBTestCase, engines_only, engines_skip
+from tests.base import DBTestCase, engine_is, engines_only, engines_skip
 
 if t.TYPE_CHECKING:
     from piccolo.columns.base import Column
@@ -103,20 +102,82 @@ def array_default_varchar():
     return ["x", "y", "z"]
 
 
+def check_row_meta(
+    row_meta: RowMeta,
+    data_type: t.Union[str, t.Tuple[str, ...]],
+    column_default: t.Union[str, t.Tuple[str, ...]],
+    is_nullable: str = "NO",
+) -> bool:
+    """
+    Can be passed to :meth:`MigrationTestCase._test_migrations` as the
+    ``test_function`` (using ``functools.partial``). A tuple can be passed
+    for ``data_type`` and ``column_default`` if more than one value is
+    acceptable - for example, if the value differs between Postgres and
+    CockroachDB.
+    """
+    if isinstance(data_type, str):
+        data_type = (data_type,)
+
+    if isinstance(column_default, str):
+        column_default = (column_default,)
+
+    return (
+        row_meta.data_type in data_type
+        and row_meta.is_nullable == is_nullable
+        and row_meta.column_default in column_default
+    )
+
+
 class MigrationTestCase(DBTestCase):
-    def _run_migrations(self, app_config: AppConfig):
+    def setUp(self) -> None:
+        # The migrations create their own tables, so we don't want the ones
+        # from DBTestCase. Each test gets its own migrations folder, created
+        # on demand by _get_migrations_folder_path.
+        self._migrations_folder_path: t.Optional[str] = None
+
+    async def _create_and_run_migrations(
+        self,
+        app_config: AppConfig,
+        table_snapshots: t.Iterable[t.List[t.Type[Table]]],
+    ) -> t.List[t.Type[Table]]:
+        """
+        Creates and runs a migration for each snapshot. It's done in a single
+        coroutine, so we don't need a new event loop for each step.
+
+        :returns:
+            The last snapshot, so the final state of the table can be checked.
+
+        """
         forwards_manager = ForwardsMigrationManager(
             app_name=app_config.app_name
         )
-        run_sync(forwards_manager.create_migration_table())
-        run_sync(forwards_manager.run_migrations(app_config=app_config))
+        await forwards_manager.create_migration_table()
+
+        table_snapshot: t.List[t.Type[Table]] = []
+        for table_snapshot in table_snapshots:
+            app_config.table_classes = table_snapshot
+            meta = await _create_new_migration(
+                app_config=app_config, auto=True, auto_input="y"
+            )
+            self.assertTrue(os.path.exists(meta.migration_path))
+            await forwards_manager.run_migrations(app_config=app_config)
+
+        return table_snapshot
 
     def _get_migrations_folder_path(self) -> str:
-        temp_directory_path = tempfile.gettempdir()
-        migrations_folder_path = os.path.join(
-            temp_directory_path, "piccolo_migrations"
-        )
-        return migrations_folder_path
+        """
+        Each test gets its own temporary directory, which is removed once the
+        test finishes. It means there are no migration files left over from
+        previous tests, and tests can be run in parallel (for example, using
+        pytest-xdist) without interfering with each other.
+        """
+        if self._migrations_folder_path is None:
+            temp_directory = tempfile.TemporaryDirectory()
+            self.addCleanup(temp_directory.cleanup)
+            self._migrations_folder_path = os.path.join(
+                temp_directory.name, "piccolo_migrations"
+            )
+        return self._migrations_folder_path
 
     def _get_app_config(self) -> AppConfig:
         return AppConfig(
@@ -127,15 +188,16 @@ class MigrationTestCase(DBTestCase):
 
     def _test_migrations(
         self,
-        table_snapshots: t.List[t.List[t.Type[Table]]],
+        table_snapshots: t.Iterable[t.List[t.Type[Table]]],
         test_function: t.Optional[t.Callable[[RowMeta], bool]] = None,
     ):
         """
         Writes a migration file to disk and runs it.
 
         :param table_snapshots:
-            A list of lists. Each sub list represents a snapshot of the table
-            state. Migrations will be created and run based on each snapshot.
+            An iterable of lists (a generator is fine, as it's only iterated
+            once). Each list represents a snapshot of the table state.
+            Migrations will be created and run based on each snapshot.
         :param test_function:
             After the migrations are run, this function is called. It is passed
             a ``RowMeta`` instance which can be used to check the column was
@@ -145,43 +207,64 @@ class MigrationTestCase(DBTestCase):
         """
         app_config = self._get_app_config()
 
-        migrations_folder_path = app_config.resolved_migrations_folder_path
+        _create_migrations_folder(app_config.resolved_migrations_folder_path)
 
-        if os.path.exists(migrations_folder_path):
-            shutil.rmtree(migrations_folder_path)
-
-        _create_migrations_folder(migrations_folder_path)
+        # The migration IDs are based on the current time, so to guarantee
+        # they're unique, each one is a microsecond after the last, rather
+        # than sleeping between migrations.
+        start = datetime.datetime.now()
+        migration_times = (
+            start + datetime.timedelta(microseconds=i)
+            for i in itertools.count()
+        )
 
-        for table_snapshot in table_snapshots:
-            app_config.table_classes = table_snapshot
-            meta = run_sync(
-                _create_new_migration(
-                    app_config=app_config, auto=True, auto_input="y"
+        with patch(
+            "piccolo.apps.migrations.commands.new.now",
+            side_effect=migration_times,
+        ):
+            last_snapshot = run_sync(
+                self._create_and_run_migrations(
+                    app_config=app_config, table_snapshots=table_snapshots
                 )
             )
-            self.assertTrue(os.path.exists(meta.migration_path))
-            self._run_migrations(app_config=app_config)
-
-            # It's kind of absurd sleeping for 1 microsecond, but it guarantees
-            # the migration IDs will be unique, and just in case computers
-            # and / or Python get insanely fast in the future :)
-            time.sleep(1e-6)
 
         if test_function:
-            column = table_snapshots[-1][-1]._meta.non_default_columns[0]
-            column_name = column._meta.db_column_name
-            schema = column._meta.table._meta.schema
-            tablename = column._meta.table._meta.tablename
+            table_meta = last_snapshot[-1]._meta
+            column_meta = table_meta.non_default_columns[0]._meta
             row_meta = self.get_postgres_column_definition(
-                tablename=tablename,
-                column_name=column_name,
-                schema=schema or "public",
+                tablename=table_meta.tablename,
+                column_name=column_meta.db_column_name,
+                schema=table_meta.schema or "public",
             )
             self.assertTrue(
                 test_function(row_meta),
                 msg=f"Meta is incorrect: {row_meta}",
             )
 
+    def _assert_tables_exist(self, table_classes: t.Iterable[t.Type[Table]]):
+        """
+        Fetches the tables in each schema once, rather than running a
+        ``table_exists`` query for every table.
+        """
+        schema_manager = SchemaManager()
+        tablenames: t.Dict[str, t.List[str]] = {}
+
+        for table_class in table_classes:
+            schema = table_class._meta.schema or "public"
+            if schema not in tablenames:
+                tablenames[schema] = schema_manager.list_tables(
+                    schema_name=schema
+                ).run_sync()
+            self.assertIn(table_class._meta.tablename, tablenames[schema])
+
+    def _drop_tables(self, *tablenames: str):
+        """
+        Drops the tables by name, so we don't need to create a ``Table`` class
+        just to drop it.
+        """
+        tables = ", ".join(f'"{tablename}"' for tablename in tablenames)
+        Migration.raw(f"DROP TABLE IF EXISTS {tables} CASCADE").run_sync()
+
     def _get_migration_managers(self):
         app_config = self._get_app_config()
 
@@ -225,14 +308,8 @@ class MigrationTestCase(DBTestCase):
 
 @engines_only("postgres", "cockroach")
 class TestMigrations(MigrationTestCase):
-    def setUp(self):
-        pass
-
     def tearDown(self):
-        create_table_class("MyTable").alter().drop_table(
-            if_exists=True
-        ).run_sync()
-        Migration.alter().drop_table(if_exists=True).run_sync()
+        self._drop_tables("my_table", Migration._meta.tablename)
 
     ###########################################################################
 
@@ -247,7 +324,7 @@ class TestMigrations(MigrationTestCase):
     @engines_skip("cockroach")
     def test_varchar_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Varchar(),
@@ -259,20 +336,17 @@ class TestMigrations(MigrationTestCase):
                     Varchar(index=True),
                     Varchar(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in ("''::character varying", "'':::STRING"),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="character varying",
+                column_default=("''::character varying", "'':::STRING"),
             ),
         )
 
     def test_text_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Text(),
@@ -283,24 +357,21 @@ class TestMigrations(MigrationTestCase):
                     Text(index=True),
                     Text(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "text",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "''",
-                        "''::text",
-                        "'':::STRING",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="text",
+                column_default=(
+                    "''",
+                    "''::text",
+                    "'':::STRING",
+                ),
             ),
         )
 
     def test_integer_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Integer(),
@@ -311,19 +382,17 @@ class TestMigrations(MigrationTestCase):
                     Integer(index=True),
                     Integer(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type in ("integer", "bigint"),  # Cockroach DB.
-                    x.is_nullable == "NO",
-                    x.column_default in ("0", "0:::INT8"),  # Cockroach DB.
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type=("integer", "bigint"),  # Cockroach DB.
+                column_default=("0", "0:::INT8"),  # Cockroach DB.
             ),
         )
 
     def test_real_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Real(),
@@ -333,19 +402,17 @@ class TestMigrations(MigrationTestCase):
                     Real(index=True),
                     Real(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "real",
-                    x.is_nullable == "NO",
-                    x.column_default in ("0.0", "0.0:::FLOAT8"),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="real",
+                column_default=("0.0", "0.0:::FLOAT8"),
             ),
         )
 
     def test_double_precision_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     DoublePrecision(),
@@ -355,19 +422,17 @@ class TestMigrations(MigrationTestCase):
                     DoublePrecision(index=True),
                     DoublePrecision(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "double precision",
-                    x.is_nullable == "NO",
-                    x.column_default in ("0.0", "0.0:::FLOAT8"),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="double precision",
+                column_default=("0.0", "0.0:::FLOAT8"),
             ),
         )
 
     def test_smallint_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     SmallInt(),
@@ -378,19 +443,17 @@ class TestMigrations(MigrationTestCase):
                     SmallInt(index=True),
                     SmallInt(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "smallint",
-                    x.is_nullable == "NO",
-                    x.column_default in ("0", "0:::INT8"),  # Cockroach DB.
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="smallint",
+                column_default=("0", "0:::INT8"),  # Cockroach DB.
             ),
         )
 
     def test_bigint_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     BigInt(),
@@ -401,19 +464,17 @@ class TestMigrations(MigrationTestCase):
                     BigInt(index=True),
                     BigInt(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "bigint",
-                    x.is_nullable == "NO",
-                    x.column_default in ("0", "0:::INT8"),  # Cockroach DB.
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="bigint",
+                column_default=("0", "0:::INT8"),  # Cockroach DB.
             ),
         )
 
     def test_uuid_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     UUID(),
@@ -431,19 +492,17 @@ class TestMigrations(MigrationTestCase):
                     UUID(index=True),
                     UUID(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "uuid",
-                    x.is_nullable == "NO",
-                    x.column_default == "uuid_generate_v4()",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="uuid",
+                column_default="uuid_generate_v4()",
             ),
         )
 
     def test_timestamp_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Timestamp(),
@@ -457,26 +516,23 @@ class TestMigrations(MigrationTestCase):
                     Timestamp(index=True),
                     Timestamp(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "timestamp without time zone",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "now()",
-                        "CURRENT_TIMESTAMP",
-                        "current_timestamp()::TIMESTAMP",
-                        "current_timestamp():::TIMESTAMPTZ::TIMESTAMP",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="timestamp without time zone",
+                column_default=(
+                    "now()",
+                    "CURRENT_TIMESTAMP",
+                    "current_timestamp()::TIMESTAMP",
+                    "current_timestamp():::TIMESTAMPTZ::TIMESTAMP",
+                ),
             ),
         )
 
     @engines_skip("cockroach")
     def test_time_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Time(),
@@ -488,20 +544,20 @@ class TestMigrations(MigrationTestCase):
                     Time(index=True),
                     Time(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "time without time zone",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in ("('now'::text)::time with time zone", "CURRENT_TIME"),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="time without time zone",
+                column_default=(
+                    "('now'::text)::time with time zone",
+                    "CURRENT_TIME",
+                ),
             ),
         )
 
     def test_date_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Date(),
@@ -513,24 +569,21 @@ class TestMigrations(MigrationTestCase):
                     Date(index=True),
                     Date(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "date",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "('now'::text)::date",
-                        "CURRENT_DATE",
-                        "current_date()",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="date",
+                column_default=(
+                    "('now'::text)::date",
+                    "CURRENT_DATE",
+                    "current_date()",
+                ),
             ),
         )
 
     def test_interval_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Interval(),
@@ -541,24 +594,21 @@ class TestMigrations(MigrationTestCase):
                     Interval(index=True),
                     Interval(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "interval",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "'00:00:00'",
-                        "'00:00:00'::interval",
-                        "'00:00:00':::INTERVAL",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="interval",
+                column_default=(
+                    "'00:00:00'",
+                    "'00:00:00'::interval",
+                    "'00:00:00':::INTERVAL",
+                ),
             ),
         )
 
     def test_boolean_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Boolean(),
@@ -569,20 +619,18 @@ class TestMigrations(MigrationTestCase):
                     Boolean(index=True),
                     Boolean(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "boolean",
-                    x.is_nullable == "NO",
-                    x.column_default == "false",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="boolean",
+                column_default="false",
             ),
         )
 
     @engines_skip("cockroach")
     def test_numeric_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Numeric(),
@@ -595,20 +643,18 @@ class TestMigrations(MigrationTestCase):
                     Numeric(index=True),
                     Numeric(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "numeric",
-                    x.is_nullable == "NO",
-                    x.column_default == "0",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="numeric",
+                column_default="0",
             ),
         )
 
     @engines_skip("cockroach")
     def test_decimal_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Decimal(),
@@ -621,13 +667,11 @@ class TestMigrations(MigrationTestCase):
                     Decimal(index=True),
                     Decimal(index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "numeric",
-                    x.is_nullable == "NO",
-                    x.column_default == "0",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="numeric",
+                column_default="0",
             ),
         )
 
@@ -637,7 +681,7 @@ class TestMigrations(MigrationTestCase):
         🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/35730 "column my_column is of type int[] and thus is not indexable"
         """  # noqa: E501
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Array(base_column=Integer()),
@@ -650,13 +694,11 @@ class TestMigrations(MigrationTestCase):
                     Array(base_column=Integer(), index=True),
                     Array(base_column=Integer(), index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "ARRAY",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::integer[]",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="ARRAY",
+                column_default="'{}'::integer[]",
             ),
         )
 
@@ -666,7 +708,7 @@ class TestMigrations(MigrationTestCase):
         🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/35730 "column my_column is of type varchar[] and thus is not indexable"
         """  # noqa: E501
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Array(base_column=Varchar()),
@@ -679,14 +721,11 @@ class TestMigrations(MigrationTestCase):
                     Array(base_column=Varchar(), index=True),
                     Array(base_column=Varchar(), index=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "ARRAY",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in ("'{}'::character varying[]", "'':::STRING"),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="ARRAY",
+                column_default=("'{}'::character varying[]", "'':::STRING"),
             ),
         )
 
@@ -697,12 +736,12 @@ class TestMigrations(MigrationTestCase):
         determine what the column type is.
         """
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Array(base_column=BigInt()),
                 ]
-            ]
+            )
         )
 
     ###########################################################################
@@ -716,7 +755,7 @@ class TestMigrations(MigrationTestCase):
         Cockroach sees all json as jsonb, so we can skip this.
         """
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     JSON(),
@@ -726,19 +765,17 @@ class TestMigrations(MigrationTestCase):
                     JSON(null=True, default=None),
                     JSON(null=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "json",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::json",
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="json",
+                column_default="'{}'::json",
             ),
         )
 
     def test_jsonb_column(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     JSONB(),
@@ -748,18 +785,15 @@ class TestMigrations(MigrationTestCase):
                     JSONB(null=True, default=None),
                     JSONB(null=False),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "jsonb",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "'{}'",
-                        "'{}'::jsonb",
-                        "'{}':::JSONB",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="jsonb",
+                column_default=(
+                    "'{}'",
+                    "'{}'::jsonb",
+                    "'{}':::JSONB",
+                ),
             ),
         )
 
@@ -767,7 +801,7 @@ class TestMigrations(MigrationTestCase):
 
     def test_db_column_name(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Varchar(),
@@ -775,18 +809,15 @@ class TestMigrations(MigrationTestCase):
                     Varchar(),
                     Varchar(db_column_name="custom_name_2"),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "''",
-                        "''::character varying",
-                        "'':::STRING",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="character varying",
+                column_default=(
+                    "''",
+                    "''::character varying",
+                    "'':::STRING",
+                ),
             ),
         )
 
@@ -796,23 +827,20 @@ class TestMigrations(MigrationTestCase):
         ``db_column_name`` specified, then the column has the correct name.
         """
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Varchar(db_column_name="custom_name"),
                 ]
-            ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in (
-                        "''",
-                        "''::character varying",
-                        "'':::STRING",
-                    ),
-                ]
+            ),
+            test_function=partial(
+                check_row_meta,
+                data_type="character varying",
+                column_default=(
+                    "''",
+                    "''::character varying",
+                    "'':::STRING",
+                ),
             ),
         )
 
@@ -826,14 +854,14 @@ class TestMigrations(MigrationTestCase):
         manage most simple ones (e.g. Varchar to Text).
         """
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Varchar(),
                     Text(),
                     Varchar(),
                 ]
-            ]
+            )
         )
 
     @engines_skip("cockroach")
@@ -842,7 +870,7 @@ class TestMigrations(MigrationTestCase):
         🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/49351 "ALTER COLUMN TYPE is not supported inside a transaction"
         """  # noqa: E501
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Integer(),
@@ -851,7 +879,7 @@ class TestMigrations(MigrationTestCase):
                     BigInt(),
                     Integer(),
                 ]
-            ]
+            )
         )
 
     @engines_skip("cockroach")
@@ -860,14 +888,14 @@ class TestMigrations(MigrationTestCase):
         🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/49351 "ALTER COLUMN TYPE is not supported inside a transaction"
         """  # noqa: E501
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Varchar(default="1"),
                     Integer(default=1),
                     Varchar(default="1"),
                 ]
-            ]
+            )
         )
 
     @engines_skip("cockroach")
@@ -876,7 +904,7 @@ class TestMigrations(MigrationTestCase):
         🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/49351 "ALTER COLUMN TYPE is not supported inside a transaction"
         """  # noqa: E501
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Real(default=1.0),
@@ -885,31 +913,31 @@ class TestMigrations(MigrationTestCase):
                     Numeric(),
                     Real(default=1.0),
                 ]
-            ]
+            )
         )
 
     def test_column_type_conversion_json(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     JSON(),
                     JSONB(),
                     JSON(),
                 ]
-            ]
+            )
         )
 
     def test_column_type_conversion_timestamp(self):
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Timestamp(),
                     Timestamptz(),
                     Timestamp(),
                 ]
-            ]
+            )
         )
 
     @patch("piccolo.apps.migrations.auto.migration_manager.colored_warning")
@@ -920,13 +948,13 @@ class TestMigrations(MigrationTestCase):
         should just output a warning.
         """
         self._test_migrations(
-            table_snapshots=[
+            table_snapshots=(
                 [self.table(column)]
                 for column in [
                     Serial(),
                     BigSerial(),
                 ]
-            ]
+            )
         )
 
         colored_warning.assert_called_once_with(
@@ -955,9 +983,6 @@ class GenreToBand(Table):
 
 @engines_only("postgres", "cockroach")
 class TestM2MMigrations(MigrationTestCase):
-    def setUp(self):
-        pass
-
     def tearDown(self):
         drop_db_tables_sync(Migration, Band, Genre, GenreToBand)
 
@@ -970,8 +995,7 @@ class TestM2MMigrations(MigrationTestCase):
             table_snapshots=[[Band, Genre, GenreToBand]],
         )
 
-        for table_class in [Band, Genre, GenreToBand]:
-            self.assertTrue(table_class.table_exists().run_sync())
+        self._assert_tables_exist([Band, Genre, GenreToBand])
 
 
 ###############################################################################
@@ -979,23 +1003,20 @@ class TestM2MMigrations(MigrationTestCase):
 
 @engines_only("postgres", "cockroach")
 class TestForeignKeys(MigrationTestCase):
-    def setUp(self):
-        class TableA(Table):
-            pass
-
-        class TableB(Table):
-            fk = ForeignKey(TableA)
-
-        class TableC(Table):
-            fk = ForeignKey(TableB)
-
-        class TableD(Table):
-            fk = ForeignKey(TableC)
-
-        class TableE(Table):
-            fk = ForeignKey(TableD)
-
-        self.table_classes = [TableA, TableB, TableC, TableD, TableE]
+    table_a = create_table_class(class_name="TableA")
+    table_b = create_table_class(
+        class_name="TableB", class_members={"fk": ForeignKey(table_a)}
+    )
+    table_c = create_table_class(
+        class_name="TableC", class_members={"fk": ForeignKey(table_b)}
+    )
+    table_d = create_table_class(
+        class_name="TableD", class_members={"fk": ForeignKey(table_c)}
+    )
+    table_e = create_table_class(
+        class_name="TableE", class_members={"fk": ForeignKey(table_d)}
+    )
+    table_classes = [table_a, table_b, table_c, table_d, table_e]
 
     def tearDown(self):
         drop_db_tables_sync(Migration, *self.table_classes)
@@ -1008,26 +1029,30 @@ class TestForeignKeys(MigrationTestCase):
         https://github.com/piccolo-orm/piccolo/issues/616
 
         """
-        # We'll shuffle them, to make it a more thorough test.
-        table_classes = random.sample(
-            self.table_classes, len(self.table_classes)
-        )
+        # Reverse them, so every table comes before the table its foreign key
+        # references - it's a more thorough test than the sorted order, and
+        # unlike a random shuffle, any failures are reproducible.
+        table_classes = self.table_classes[::-1]
 
         self._test_migrations(table_snapshots=[table_classes])
-        for table_class in table_classes:
-            self.assertTrue(table_class.table_exists().run_sync())
+        self._assert_tables_exist(table_classes)
 
 
 @engines_only("postgres", "cockroach")
 class TestTargetColumn(MigrationTestCase):
-    def setUp(self):
-        class TableA(Table):
-            name = Varchar(unique=True)
-
-        class TableB(Table):
-            table_a = ForeignKey(TableA, target_column=TableA.name)
-
-        self.table_classes = [TableA, TableB]
+    table_a = create_table_class(
+        class_name="TableA", class_members={"name": Varchar(unique=True)}
+    )
+    table_b = create_table_class(
+        class_name="TableB",
+        class_members={
+            "table_a": ForeignKey(
+                table_a,
+                target_column=table_a._meta.get_column_by_name("name"),
+            )
+        },
+    )
+    table_classes = [table_a, table_b]
 
     def tearDown(self):
         drop_db_tables_sync(Migration, *self.table_classes)
@@ -1041,35 +1066,55 @@ class TestTargetColumn(MigrationTestCase):
             table_snapshots=[self.table_classes],
         )
 
-        for table_class in self.table_classes:
-            self.assertTrue(table_class.table_exists().run_sync())
+        self._assert_tables_exist(self.table_classes)
 
         # Make sure the constraint was created correctly.
-        response = self.run_sync(
-            """
-            SELECT EXISTS(
-                SELECT 1
-                FROM INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE CCU
-                JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS TC ON
-                    CCU.CONSTRAINT_NAME = TC.CONSTRAINT_NAME
-                WHERE CONSTRAINT_TYPE = 'FOREIGN KEY'
-                    AND TC.TABLE_NAME = 'table_b'
-                    AND CCU.TABLE_NAME = 'table_a'
-                    AND CCU.COLUMN_NAME = 'name'
+        if engine_is("cockroach"):
+            response = self.run_sync(
+                """
+                SELECT EXISTS(
+                    SELECT 1
+                    FROM INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE CCU
+                    JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS TC ON
+                        CCU.CONSTRAINT_NAME = TC.CONSTRAINT_NAME
+                    WHERE CONSTRAINT_TYPE = 'FOREIGN KEY'
+                        AND TC.TABLE_NAME = 'table_b'
+                        AND CCU.TABLE_NAME = 'table_a'
+                        AND CCU.COLUMN_NAME = 'name'
+                )
+                """
+            )
+        else:
+            # Query the catalog directly, rather than joining the
+            # INFORMATION_SCHEMA views, which is much slower.
+            response = self.run_sync(
+                """
+                SELECT EXISTS(
+                    SELECT 1
+                    FROM pg_constraint C
+                    JOIN pg_attribute A ON
+                        A.attrelid = C.confrelid
+                        AND A.attnum = ANY(C.confkey)
+                    WHERE C.contype = 'f'
+                        AND C.conrelid = 'table_b'::regclass
+                        AND C.confrelid = 'table_a'::regclass
+                        AND A.attname = 'name'
+                )
+                """
             )
-            """
-        )
         self.assertTrue(response[0]["exists"])
 
 
 @engines_only("postgres", "cockroach")
 class TestForeignKeySelf(MigrationTestCase):
-    def setUp(self) -> None:
-        class TableA(Table):
-            id = UUID(primary_key=True)
-            table_a: ForeignKey[TableA] = ForeignKey("self")
-
-        self.table_classes: t.List[t.Type[Table]] = [TableA]
+    table_a = create_table_class(
+        class_name="TableA",
+        class_members={
+            "id": UUID(primary_key=True),
+            "table_a": ForeignKey("self"),
+        },
+    )
+    table_classes = [table_a]
 
     def tearDown(self):
         drop_db_tables_sync(Migration, *self.table_classes)
@@ -1087,17 +1132,13 @@ class TestForeignKeySelf(MigrationTestCase):
             test_function=lambda x: x.data_type == "uuid",
         )
 
-        for table_class in self.table_classes:
-            self.assertTrue(table_class.table_exists().run_sync())
+        self._assert_tables_exist(self.table_classes)
 
 
 @engines_only("postgres", "cockroach")
 class TestAddForeignKeySelf(MigrationTestCase):
-    def setUp(self):
-        pass
-
     def tearDown(self):
-        drop_db_tables_sync(create_table_class("MyTable"), Migration)
+        self._drop_tables("my_table", Migration._meta.tablename)
 
     @patch("piccolo.conf.apps.Finder.get_app_config")
     def test_add_column(self, get_app_config):
@@ -1140,13 +1181,11 @@ class TestAddForeignKeySelf(MigrationTestCase):
 @engines_only("postgres", "cockroach")
 class TestSchemas(MigrationTestCase):
     new_schema = "schema_1"
-
-    def setUp(self) -> None:
-        self.schema_manager = SchemaManager()
-        self.manager_1 = create_table_class(class_name="Manager")
-        self.manager_2 = create_table_class(
-            class_name="Manager", class_kwargs={"schema": self.new_schema}
-        )
+    schema_manager = SchemaManager()
+    manager_1 = create_table_class(class_name="Manager")
+    manager_2 = create_table_class(
+        class_name="Manager", class_kwargs={"schema": new_schema}
+    )
 
     def tearDown(self) -> None:
         self.schema_manager.drop_schema(
@@ -1338,18 +1377,14 @@ class TestSameTableName(MigrationTestCase):
 
     new_schema = "schema_1"
     tablename = "manager"
-
-    def setUp(self) -> None:
-        self.schema_manager = SchemaManager()
-
-        self.manager_1 = create_table_class(
-            class_name="Manager1", class_kwargs={"tablename": self.tablename}
-        )
-
-        self.manager_2 = create_table_class(
-            class_name="Manager2",
-            class_kwargs={"tablename": self.tablename, "schema": "schema_1"},
-        )
+    schema_manager = SchemaManager()
+    manager_1 = create_table_class(
+        class_name="Manager1", class_kwargs={"tablename": tablename}
+    )
+    manager_2 = create_table_class(
+        class_name="Manager2",
+        class_kwargs={"tablename": tablename, "schema": new_schema},
+    )
 
     def tearDown(self) -> None:
         self.schema_manager.drop_schema(
@@ -1394,17 +1429,14 @@ class TestForeignKeyWithSchema(MigrationTestCase):
 
     schema = "schema_1"
     schema_manager = SchemaManager()
-
-    def setUp(self) -> None:
-        self.manager = create_table_class(
-            class_name="Manager", class_kwargs={"schema": self.schema}
-        )
-
-        self.band = create_table_class(
-            class_name="Band",
-            class_kwargs={"schema": self.schema},
-            class_members={"manager": ForeignKey(self.manager)},
-        )
+    manager = create_table_class(
+        class_name="Manager", class_kwargs={"schema": schema}
+    )
+    band = create_table_class(
+        class_name="Band",
+        class_kwargs={"schema": schema},
+        class_members={"manager": ForeignKey(manager)},
+    )
 
     def tearDown(self) -> None:
         self.schema_manager.drop_schema(
@@ -1448,9 +1480,6 @@ class TestRenameTable(MigrationTestCase):
         class_members={"name": Varchar()},
     )
 
-    def setUp(self) -> None:
-        pass
-
     def tearDown(self) -> None:
         drop_db_tables_sync(self.manager, self.manager_1, Migration)
 
@@ -26,8 +26,9 @@ class TestTargetColumnWithString(TestCase):
         drop_db_tables_sync(Manager, Band)
 
     def test_queries(self):
-        manager_1 = Manager.objects().create(name="Guido").run_sync()
-        manager_2 = Manager.objects().create(name="Graydon").run_sync()
+        manager_1 = Manager(name="Guido")
+        manager_2 = Manager(name="Graydon")
+        Manager.insert(manager_1, manager_2).run_sync()
 
         Band.insert(
             Band(name="Pythonistas", manager=manager_1),
@@ -69,8 +70,9 @@ class TestTargetColumnWithColumnRef(TestCase):
         drop_db_tables_sync(ManagerA, BandA)
 
     def test_queries(self):
-        manager_1 = ManagerA.objects().create(name="Guido").run_sync()
-        manager_2 = ManagerA.objects().create(name="Graydon").run_sync()
+        manager_1 = ManagerA(name="Guido")
+        manager_2 = ManagerA(name="Graydon")
+        ManagerA.insert(manager_1, manager_2).run_sync()
 
         BandA.insert(
             BandA(name="Pythonistas", manager=manager_1),
@@ -87,13 +87,15 @@ class TestM2MCustomPrimaryKey(TestCase):
     def setUp(self):
         create_db_tables_sync(*CUSTOM_PK_SCHEMA, if_not_exists=True)
 
-        bob = Customer.objects().create(name="Bob").run_sync()
-        sally = Customer.objects().create(name="Sally").run_sync()
-        fred = Customer.objects().create(name="Fred").run_sync()
-
-        rockfest = Concert.objects().create(name="Rockfest").run_sync()
-        folkfest = Concert.objects().create(name="Folkfest").run_sync()
-        classicfest = Concert.objects().create(name="Classicfest").run_sync()
+        bob = Customer(name="Bob")
+        sally = Customer(name="Sally")
+        fred = Customer(name="Fred")
+        Customer.insert(bob, sally, fred).run_sync()
+
+        rockfest = Concert(name="Rockfest")
+        folkfest = Concert(name="Folkfest")
+        classicfest = Concert(name="Classicfest")
+        Concert.insert(rockfest, folkfest, classicfest).run_sync()
 
         CustomerToConcert.insert(
             CustomerToConcert(customer=bob, concert=rockfest),
@@ -1,13 +1,14 @@
 import timeit
 import typing as t
 from dataclasses import dataclass
-from unittest import mock
+from unittest import TestCase, mock
 
 from piccolo.columns import Integer, Varchar
 from piccolo.query.base import FrozenQuery, Query
 from piccolo.table import Table
+from piccolo.utils.sync import run_sync
 from tests.base import AsyncMock, DBTestCase, sqlite_only
-from tests.example_apps.music.tables import Band
+from tests.example_apps.music.tables import Band, RecordingStudio
 
 
 @dataclass
@@ -117,6 +118,21 @@ class TestFreeze(DBTestCase):
             sum(sorted(frozen_query_duration)[10:-10]),
         )
 
+    def test_await(self):
+        """
+        Make sure frozen queries can be awaited directly.
+        """
+        self.insert_rows()
+
+        query = (
+            Band.select(Band.name).where(Band.name == "Pythonistas").freeze()
+        )
+
+        async def run_query():
+            return await query
+
+        self.assertEqual(run_sync(run_query()), [{"name": "Pythonistas"}])
+
     def test_attribute_access(self):
         """
         Once frozen, you shouldn't be able to call additional methods on the
@@ -126,3 +142,33 @@ class TestFreeze(DBTestCase):
 
         with self.assertRaises(AttributeError):
             query.where(Band.name == "Pythonistas")
+
+
+class TestFreezeLoadJSON(TestCase):
+    def setUp(self):
+        RecordingStudio.create_table().run_sync()
+        RecordingStudio(
+            facilities={"mixing_desk": True}, facilities_b={"amplifier": 2}
+        ).save().run_sync()
+
+    def tearDown(self):
+        RecordingStudio.alter().drop_table().run_sync()
+
+    def test_load_json(self):
+        """
+        Make sure the selected JSON columns are still deserialised once the
+        query is frozen.
+        """
+        query = RecordingStudio.select(
+            RecordingStudio.facilities,
+            RecordingStudio.facilities_b.as_alias("facilities_alias"),
+        ).output(load_json=True)
+        expected = [
+            {
+                "facilities": {"mixing_desk": True},
+                "facilities_alias": {"amplifier": 2},
+            }
+        ]
+
+        self.assertEqual(query.run_sync(), expected)
+        self.assertEqual(query.freeze().run_sync(), expected)
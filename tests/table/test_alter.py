@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import typing as t
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 import pytest
 
 from piccolo.columns import BigInt, Integer, Numeric, Varchar
-from piccolo.columns.base import Column
+from piccolo.columns.base import Column, OnDelete, OnUpdate
 from piccolo.columns.column_types import ForeignKey, Text
+from piccolo.query.methods.alter import AddForeignKeyConstraint, DropColumn
 from piccolo.schema import SchemaManager
 from piccolo.table import Table
 from tests.base import (
@@ -417,3 +419,127 @@ class TestSetDigits(TestCase):
         response = Ticket.raw(query).run_sync()
         self.assertIsNone(response[0]["numeric_precision"])
         self.assertIsNone(response[0]["numeric_scale"])
+
+
+###############################################################################
+
+
+class TestDDL(TestCase):
+    """
+    Make sure the generated DDL is correct for each engine, without needing
+    to connect to the database.
+    """
+
+    def _get_table(self, engine_type: str) -> t.Type[Table]:
+        db = MagicMock()
+        db.engine_type = engine_type
+
+        class Musician(Table, db=db):
+            name = Varchar()
+            popularity = Integer()
+
+        return Musician
+
+    def test_postgres(self):
+        Musician = self._get_table(engine_type="postgres")
+        query = (
+            Musician.alter()
+            .rename_column(Musician.popularity, "rating")
+            .set_null(Musician.name, boolean=False)
+        )
+        self.assertEqual(
+            query.ddl,
+            [
+                'ALTER TABLE "musician" RENAME COLUMN "popularity" TO '
+                '"rating", ALTER COLUMN "name" SET NOT NULL'
+            ],
+        )
+
+    def test_sqlite(self):
+        """
+        SQLite can only perform one alteration per statement.
+        """
+        Musician = self._get_table(engine_type="sqlite")
+        query = (
+            Musician.alter()
+            .rename_column(Musician.popularity, "rating")
+            .drop_column(Musician.name)
+        )
+        self.assertEqual(
+            query.ddl,
+            [
+                'ALTER TABLE "musician" RENAME COLUMN "popularity" TO '
+                '"rating"',
+                'ALTER TABLE "musician" DROP COLUMN "name"',
+            ],
+        )
+
+    def test_set_default(self):
+        Musician = self._get_table(engine_type="postgres")
+        query = Musician.alter().set_default(Musician.popularity, 1000)
+        self.assertEqual(
+            query.ddl,
+            [
+                'ALTER TABLE "musician" ALTER COLUMN "popularity" SET '
+                "DEFAULT 1000"
+            ],
+        )
+
+    def test_set_column_type(self):
+        Musician = self._get_table(engine_type="postgres")
+        query = Musician.alter().set_column_type(
+            Musician.popularity,
+            Varchar(),
+            using_expression="popularity::varchar",
+        )
+        self.assertEqual(
+            query.ddl,
+            [
+                'ALTER TABLE "musician" ALTER COLUMN "popularity" TYPE '
+                "VARCHAR(255) USING popularity::varchar"
+            ],
+        )
+
+    def test_no_alterations(self):
+        Musician = self._get_table(engine_type="postgres")
+        self.assertEqual(Musician.alter().ddl, ['ALTER TABLE "musician"'])
+
+
+class TestAddForeignKeyConstraint(TestCase):
+    def test_ddl(self):
+        statement = AddForeignKeyConstraint(
+            constraint_name="band_manager_fk",
+            foreign_key_column_name="manager",
+            referenced_table_name="manager",
+            on_delete=OnDelete.cascade,
+            on_update=None,
+        )
+        self.assertEqual(
+            statement.ddl,
+            'ADD CONSTRAINT "band_manager_fk" FOREIGN KEY ("manager") '
+            'REFERENCES "manager" ("id") ON DELETE CASCADE',
+        )
+
+    def test_referenced_column_name(self):
+        statement = AddForeignKeyConstraint(
+            constraint_name="band_manager_fk",
+            foreign_key_column_name="manager",
+            referenced_table_name="manager",
+            on_delete=None,
+            on_update=OnUpdate.restrict,
+            referenced_column_name="name",
+        )
+        self.assertEqual(
+            statement.ddl,
+            'ADD CONSTRAINT "band_manager_fk" FOREIGN KEY ("manager") '
+            'REFERENCES "manager" ("name") ON UPDATE RESTRICT',
+        )
+
+
+class TestAlterColumnStatement(TestCase):
+    def test_unrecognised_column_type(self):
+        """
+        Make sure an error is raised as soon as the statement is created.
+        """
+        with self.assertRaises(ValueError):
+            DropColumn(column=1)  # type: ignore
@@ -26,3 +26,82 @@ class TestConstructor(TestCase):
         band = Band({Band.name: "Pythonistas"}, popularity=1000)
         self.assertEqual(band.name, "Pythonistas")
         self.assertEqual(band.popularity, 1000)
+
+
+class TestFromDBRows(TestCase):
+    def setUp(self):
+        # A row containing a value for every column.
+        self.row = {
+            "id": 1,
+            "name": "Pythonistas",
+            "manager": 2,
+            "popularity": 1000,
+        }
+
+    def test_all_columns(self):
+        """
+        Make sure an instance is created when every column value is present.
+        """
+        band = Band._from_db_rows([self.row])[0]
+        self.assertEqual(band.id, 1)
+        self.assertEqual(band.name, "Pythonistas")
+        self.assertEqual(band.manager, 2)
+        self.assertEqual(band.popularity, 1000)
+        self.assertTrue(band._exists_in_db)
+
+    def test_missing_columns(self):
+        """
+        If some column values are missing, we fall back to the constructor,
+        so defaults are still applied.
+        """
+        del self.row["manager"]
+        del self.row["popularity"]
+
+        band = Band._from_db_rows([self.row])[0]
+        self.assertEqual(band.name, "Pythonistas")
+        self.assertEqual(band.popularity, 0)
+        self.assertTrue(band._exists_in_db)
+
+    def test_custom_constructor(self):
+        """
+        Make sure a subclass's constructor is still called.
+        """
+
+        class MyBand(Band, tablename="my_band"):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.initialised = True
+
+        band = MyBand._from_db_rows([self.row])[0]
+        self.assertTrue(band.initialised)
+        self.assertTrue(band._exists_in_db)
+
+    def test_custom_setattr(self):
+        """
+        Make sure a subclass's ``__setattr__`` still sees every value.
+        """
+
+        class MyBand(Band, tablename="my_band"):
+            def __setattr__(self, name, value):
+                self.__dict__.setdefault("set_names", []).append(name)
+                super().__setattr__(name, value)
+
+        band = MyBand._from_db_rows([self.row])[0]
+        for name in self.row:
+            self.assertIn(name, band.set_names)
+        self.assertTrue(band._exists_in_db)
+
+    def test_custom_setitem(self):
+        """
+        Make sure a subclass's ``__setitem__`` still sees every value.
+        """
+
+        class MyBand(Band, tablename="my_band"):
+            def __setitem__(self, key, value):
+                self.__dict__.setdefault("set_keys", []).append(key)
+                super().__setitem__(key, value)
+
+        band = MyBand._from_db_rows([self.row])[0]
+        for key in self.row:
+            self.assertIn(key, band.set_keys)
+        self.assertTrue(band._exists_in_db)
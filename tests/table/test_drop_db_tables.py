@@ -1,10 +1,13 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
+from piccolo.columns import ForeignKey
 from piccolo.table import (
+    Table,
     create_db_tables_sync,
     drop_db_tables_sync,
     drop_tables,
 )
+from tests.base import AsyncMock
 from tests.example_apps.music.tables import Band, Manager
 
 
@@ -35,3 +38,26 @@ class TestDropTables(TestCase):
 
         self.assertFalse(Manager.table_exists().run_sync())
         self.assertFalse(Band.table_exists().run_sync())
+
+
+class TestDropTablesSingleStatement(TestCase):
+    def test_postgres(self):
+        """
+        Postgres and CockroachDB should drop all of the tables in a single
+        statement.
+        """
+        db = mock.MagicMock()
+        db.engine_type = "postgres"
+        db.run_ddl = AsyncMock()
+
+        class Manager(Table, db=db):
+            pass
+
+        class Band(Table, db=db, schema="music"):
+            manager = ForeignKey(Manager)
+
+        drop_db_tables_sync(Manager, Band, Manager)
+
+        db.run_ddl.assert_called_once_with(
+            'DROP TABLE IF EXISTS "manager", "music"."band" CASCADE'
+        )
@@ -335,6 +335,17 @@ class TestJoin(TestCase):
         assert band is not None
         self.assertIsInstance(band.manager, Manager)
 
+    def test_objects_nested_multiple_rows(self):
+        """
+        Make sure each object gets the correct related object when multiple
+        rows are returned.
+        """
+        bands = Band.objects(Band.manager).order_by(Band.name).run_sync()
+        self.assertEqual(
+            [(band.name, band.manager.name) for band in bands],
+            [("Pythonistas", "Guido"), ("Rustaceans", "Graydon")],
+        )
+
     def test_objects__all_related__root(self):
         """
         Make sure that ``all_related`` works correctly when called from the
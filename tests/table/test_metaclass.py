@@ -121,6 +121,9 @@ class TestMetaClass(TestCase):
         self.assertEqual(
             MyTable._meta.json_columns, [MyTable.column_a, MyTable.column_b]
         )
+        self.assertEqual(
+            MyTable._meta.json_column_names, ("column_a", "column_b")
+        )
 
     def test_email_columns(self):
         """